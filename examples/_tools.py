@@ -1,5 +1,19 @@
 import argparse
 
+import numpy as np
+
+
+def symmetrize(matrix):
+    """Symmetrize a square matrix.
+
+    Computes ``0.5 * (matrix + matrix.T)`` through a single preallocated
+    buffer instead of materializing two intermediate matrices.
+    """
+    buffer = np.empty_like(matrix)
+    np.add(matrix, matrix.T, out=buffer)
+    buffer *= 0.5
+    return buffer
+
 
 def _parse_arguments(name, backends):
     parser = argparse.ArgumentParser(name)
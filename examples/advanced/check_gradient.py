@@ -3,7 +3,7 @@ import tensorflow as tf
 import torch
 
 import pymanopt
-from examples._tools import ExampleRunner
+from examples._tools import ExampleRunner, symmetrize
 from pymanopt import Problem
 from pymanopt.manifolds import Sphere
 from pymanopt.tools.diagnostics import check_gradient
@@ -56,7 +56,7 @@ def run(backend=SUPPORTED_BACKENDS[0], quiet=True):
 
     # Generate random problem data.
     matrix = np.random.randn(n, n)
-    matrix = 0.5 * (matrix + matrix.T)
+    matrix = symmetrize(matrix)
     cost, egrad = create_cost_egrad(manifold, matrix, backend)
 
     # Create the problem structure.
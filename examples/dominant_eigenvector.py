@@ -5,7 +5,7 @@ from numpy import linalg as la
 from numpy import random as rnd
 
 import pymanopt
-from examples._tools import ExampleRunner
+from examples._tools import ExampleRunner, symmetrize
 from pymanopt.manifolds import Sphere
 from pymanopt.solvers import SteepestDescent
 
@@ -54,7 +54,7 @@ def create_cost_egrad(manifold, matrix, backend):
 def run(backend=SUPPORTED_BACKENDS[0], quiet=True):
     n = 128
     matrix = rnd.randn(n, n)
-    matrix = 0.5 * (matrix + matrix.T)
+    matrix = symmetrize(matrix)
 
     manifold = Sphere(n)
     cost, egrad = create_cost_egrad(manifold, matrix, backend)
@@ -5,7 +5,7 @@ from numpy import linalg as la
 from numpy import random as rnd
 
 import pymanopt
-from examples._tools import ExampleRunner
+from examples._tools import ExampleRunner, symmetrize
 from pymanopt.manifolds import Grassmann
 from pymanopt.solvers import TrustRegions
 
@@ -70,7 +70,7 @@ def run(backend=SUPPORTED_BACKENDS[0], quiet=True):
     num_rows = 128
     subspace_dimension = 3
     matrix = rnd.randn(num_rows, num_rows)
-    matrix = 0.5 * (matrix + matrix.T)
+    matrix = symmetrize(matrix)
 
     manifold = Grassmann(num_rows, subspace_dimension)
     cost, egrad, ehess = create_cost_egrad_ehess(manifold, matrix, backend)
@@ -5,7 +5,7 @@ from numpy import linalg as la
 from numpy import random as rnd
 
 import pymanopt
-from examples._tools import ExampleRunner
+from examples._tools import ExampleRunner, symmetrize
 from pymanopt.manifolds import Oblique
 from pymanopt.solvers import TrustRegions
 
@@ -65,7 +65,7 @@ def run(backend=SUPPORTED_BACKENDS[0], quiet=True):
     num_rows = 10
     rank = 3
     matrix = rnd.randn(num_rows, num_rows)
-    matrix = 0.5 * (matrix + matrix.T)
+    matrix = symmetrize(matrix)
 
     # Solve the problem with pymanopt.
     manifold = Oblique(rank, num_rows)
@@ -58,9 +58,12 @@ def backend_decorator_factory(Backend) -> typing.Callable:
 
     Returns:
         A new backend decorator.
+        Keyword arguments passed to the decorator beyond the manifold are
+        forwarded to the backend constructor, e.g. ``static_argnums`` for the
+        JAX backend.
     """
 
-    def decorator(manifold):
+    def decorator(manifold, **backend_kwargs):
         if not isinstance(manifold, Manifold):
             raise TypeError(
                 "Backend decorator requires a manifold instance, got "
@@ -79,7 +82,9 @@ def backend_decorator_factory(Backend) -> typing.Callable:
                     "or a variable-length argument like *x"
                 )
             return Function(
-                function=function, manifold=manifold, backend=Backend()
+                function=function,
+                manifold=manifold,
+                backend=Backend(**backend_kwargs),
             )
 
         return inner
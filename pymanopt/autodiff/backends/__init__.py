@@ -1,15 +1,36 @@
+import importlib
+
+
 __all__ = ["jax", "autograd", "numpy", "pytorch", "tensorflow"]
 
-from .. import backend_decorator_factory
-from ._jax import JaxBackend
-from ._autograd import AutogradBackend
-from ._numpy import NumPyBackend
-from ._pytorch import PyTorchBackend
-from ._tensorflow import TensorFlowBackend
+# Map from decorator name to the module and class implementing the backend.
+# Backend modules are only imported when a decorator is first accessed
+# (PEP 562): each module probes for its (potentially heavyweight) framework
+# at import time, which would otherwise be paid for all five backends even
+# if only one is ever used.
+_BACKENDS = {
+    "jax": ("._jax", "JaxBackend"),
+    "autograd": ("._autograd", "AutogradBackend"),
+    "numpy": ("._numpy", "NumPyBackend"),
+    "pytorch": ("._pytorch", "PyTorchBackend"),
+    "tensorflow": ("._tensorflow", "TensorFlowBackend"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, class_name = _BACKENDS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    from .. import backend_decorator_factory
+
+    module = importlib.import_module(module_name, __name__)
+    decorator = backend_decorator_factory(getattr(module, class_name))
+    globals()[name] = decorator
+    return decorator
 
 
-jax = backend_decorator_factory(JaxBackend)
-autograd = backend_decorator_factory(AutogradBackend)
-numpy = backend_decorator_factory(NumPyBackend)
-pytorch = backend_decorator_factory(PyTorchBackend)
-tensorflow = backend_decorator_factory(TensorFlowBackend)
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,14 +2,28 @@
 Module containing functions to differentiate functions using JAX.
 """
 import functools
+import os
 
 try:
-    from jax.config import config
-
-    config.update("jax_enable_x64", True)
     import jax
     import jax.numpy as np
     from jax import jit
+
+    jax.config.update("jax_enable_x64", True)
+
+    # Opt into JAX's persistent compilation cache so that subsequent runs of
+    # a process skip XLA compilation of cost/gradient/Hessian programs. The
+    # PYMANOPT_JAX_CACHE environment variable relocates the cache directory;
+    # setting it to an empty string disables the cache.
+    _cache_dir = os.environ.get(
+        "PYMANOPT_JAX_CACHE", os.path.join("~", ".cache", "pymanopt", "jax")
+    )
+    if _cache_dir:
+        jax.config.update(
+            "jax_compilation_cache_dir", os.path.expanduser(_cache_dir)
+        )
+        jax.config.update("jax_persistent_cache_min_entry_size_bytes", -1)
+        jax.config.update("jax_persistent_cache_min_compile_time_secs", 1.0)
 except ImportError:
     jax = None
 
@@ -18,8 +32,19 @@ from ...tools import bisect_sequence, unpack_singleton_sequence_return_value
 
 
 class JaxBackend(Backend):
-    def __init__(self):
+    """JAX autodiff backend.
+
+    Args:
+        static_argnums: Arguments treated as compile-time constants, passed
+            through to :func:`jax.jit` when compiling the cost function.
+        donate_argnums: Argument buffers donated to the computation, passed
+            through to :func:`jax.jit` when compiling the cost function.
+    """
+
+    def __init__(self, static_argnums=None, donate_argnums=None):
         super().__init__("Jax")
+        self._static_argnums = static_argnums
+        self._donate_argnums = donate_argnums
 
     @staticmethod
     def is_available():
@@ -35,11 +60,20 @@ class JaxBackend(Backend):
 
     @Backend._assert_backend_available
     def prepare_function(self, function):
-        return jit(function)
+        kwargs = {}
+        if self._static_argnums is not None:
+            kwargs["static_argnums"] = self._static_argnums
+        if self._donate_argnums is not None:
+            kwargs["donate_argnums"] = self._donate_argnums
+        return jit(function, **kwargs)
 
     @Backend._assert_backend_available
     def compute_gradient(self, function, num_arguments):
-        gradient = jax.grad(function, argnums=list(range(num_arguments)))
+        # Differentiate the raw function and jit the result so the whole
+        # gradient computation is staged out as one cached XLA program.
+        gradient = jit(
+            jax.grad(function, argnums=list(range(num_arguments)))
+        )
         if num_arguments == 1:
             return unpack_singleton_sequence_return_value(gradient)
         return gradient
@@ -48,22 +82,21 @@ class JaxBackend(Backend):
     def _hessian_vector_product(function, argnum):
         gradient = jax.grad(function, argnum)
 
-        def vector_dot_gradient(*args):
+        def hessian_vector_product(*args):
             arguments, vectors = args[:-1], args[-1]
-            gradients = gradient(*arguments)
-            return np.sum(
-                [
-                    np.tensordot(gradient, vector, axes=vector.ndim)
-                    for gradient, vector in zip(gradients, vectors)
-                ]
-            )
+            # Forward-over-reverse differentiation: push the vectors through
+            # the linearization of the gradient in a single forward pass.
+            _, hvp = jax.jvp(gradient, arguments, tuple(vectors))
+            return hvp
 
-        return jax.grad(vector_dot_gradient, argnum)
+        return hessian_vector_product
 
     @Backend._assert_backend_available
     def compute_hessian_vector_product(self, function, num_arguments):
-        hessian_vector_product = self._hessian_vector_product(
-            function, argnum=tuple(range(num_arguments))
+        hessian_vector_product = jit(
+            self._hessian_vector_product(
+                function, argnum=tuple(range(num_arguments))
+            )
         )
 
         @functools.wraps(hessian_vector_product)
@@ -80,6 +80,9 @@ class Problem:
             hess = self._wrap_hessian_vector_product(hess)
         self._hess = hess
 
+        # Record whether the preconditioner is the identity so solvers can
+        # skip the no-op call in their hot loops.
+        self._precon_is_identity = precon is None
         if precon is None:
 
             def precon(x, d):
@@ -1,9 +1,19 @@
 __all__ = ["jax", "autograd", "numpy", "pytorch", "tensorflow"]
 
-from pymanopt.autodiff.backends import (
-    jax,
-    autograd,
-    numpy,
-    pytorch,
-    tensorflow,
-)
+
+def __getattr__(name):
+    # Resolve backend decorators lazily so that accessing one backend does
+    # not trigger framework imports for the other four.
+    if name not in __all__:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        )
+    from pymanopt.autodiff import backends
+
+    decorator = getattr(backends, name)
+    globals()[name] = decorator
+    return decorator
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,3 +1,6 @@
+import importlib
+
+
 __all__ = [
     "ComplexCircle",
     "ComplexEuclidean",
@@ -23,21 +26,48 @@ __all__ = [
     "SymmetricPositiveDefinite",
 ]
 
-from .complex_circle import ComplexCircle
-from .complex_euclidean import ComplexEuclidean
-from .euclidean import Euclidean, SkewSymmetric, Symmetric
-from .fixed_rank import FixedRankEmbedded
-from .grassmann import ComplexGrassmann, Grassmann
-from .hpd import HermitianPositiveDefinite, SpecialHermitianPositiveDefinite
-from .oblique import Oblique
-from .positive_definite import SymmetricPositiveDefinite
-from .product import Product
-from .psd import Elliptope, PSDFixedRank, PSDFixedRankComplex
-from .special_orthogonal_group import SpecialOrthogonalGroup
-from .sphere import (
-    Sphere,
-    SphereSubspaceComplementIntersection,
-    SphereSubspaceIntersection,
-)
-from .stiefel import Stiefel
-from .strictly_positive_vectors import StrictlyPositiveVectors
+# Map from manifold class name to the submodule defining it. The modules are
+# only imported when a manifold is first accessed (PEP 562) since several of
+# them pull in heavyweight SciPy modules which would otherwise slow down
+# every `import pymanopt`.
+_MANIFOLD_MODULES = {
+    "ComplexCircle": "complex_circle",
+    "ComplexEuclidean": "complex_euclidean",
+    "ComplexGrassmann": "grassmann",
+    "Elliptope": "psd",
+    "Euclidean": "euclidean",
+    "FixedRankEmbedded": "fixed_rank",
+    "Grassmann": "grassmann",
+    "HermitianPositiveDefinite": "hpd",
+    "Oblique": "oblique",
+    "PSDFixedRank": "psd",
+    "PSDFixedRankComplex": "psd",
+    "Product": "product",
+    "SkewSymmetric": "euclidean",
+    "SpecialHermitianPositiveDefinite": "hpd",
+    "SpecialOrthogonalGroup": "special_orthogonal_group",
+    "Sphere": "sphere",
+    "SphereSubspaceComplementIntersection": "sphere",
+    "SphereSubspaceIntersection": "sphere",
+    "Stiefel": "stiefel",
+    "StrictlyPositiveVectors": "strictly_positive_vectors",
+    "Symmetric": "euclidean",
+    "SymmetricPositiveDefinite": "positive_definite",
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _MANIFOLD_MODULES[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    module = importlib.import_module(f".{module_name}", __name__)
+    manifold = getattr(module, name)
+    globals()[name] = manifold
+    return manifold
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
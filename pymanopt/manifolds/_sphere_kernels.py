@@ -0,0 +1,115 @@
+"""
+Numba-compiled kernels for the elementary operations of 1-D spheres.
+
+For small vectors the cost of the generic NumPy implementations in
+:mod:`pymanopt.manifolds.sphere` is dominated by per-call dispatch overhead.
+The kernels below take the same arguments as the corresponding manifold
+methods and are bound directly on :class:`pymanopt.manifolds.sphere.Sphere`
+instances of vectors when Numba is importable. Operands are coerced to
+writable double-precision arrays first, since the compiled kernels cannot
+handle read-only buffers such as JAX arrays or broadcast views.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+available = njit is not None
+
+
+def _as_operand(array):
+    array = np.asarray(array, dtype=np.float64)
+    if not array.flags.writeable:
+        array = array.copy()
+    return array
+
+
+if available:
+    _jit = njit(fastmath=True, cache=True)
+
+    @_jit
+    def _inner(tangent_vector_a, tangent_vector_b):
+        return np.dot(tangent_vector_a, tangent_vector_b)
+
+    @_jit
+    def _norm(tangent_vector):
+        return np.sqrt(np.dot(tangent_vector, tangent_vector))
+
+    @_jit
+    def _proj(point, vector):
+        return vector - np.dot(point, vector) * point
+
+    @_jit
+    def _dist(point_a, point_b):
+        cosine = np.dot(point_a, point_b)
+        if cosine > 1.0:
+            cosine = 1.0
+        elif cosine < -1.0:
+            cosine = -1.0
+        return np.arccos(cosine)
+
+    @_jit
+    def _exp(point, tangent_vector):
+        norm = np.sqrt(np.dot(tangent_vector, tangent_vector))
+        if norm > 0.0:
+            factor = np.sin(norm) / norm
+        else:
+            factor = 1.0
+        return point * np.cos(norm) + tangent_vector * factor
+
+    @_jit
+    def _retr(point, tangent_vector):
+        target = point + tangent_vector
+        return target / np.sqrt(np.dot(target, target))
+
+    @_jit
+    def _log(point_a, point_b):
+        vector = point_b - point_a
+        vector = vector - np.dot(point_a, vector) * point_a
+        cosine = np.dot(point_a, point_b)
+        if cosine > 1.0:
+            cosine = 1.0
+        elif cosine < -1.0:
+            cosine = -1.0
+        distance = np.arccos(cosine)
+        epsilon = np.finfo(np.float64).eps
+        factor = (distance + epsilon) / (
+            np.sqrt(np.dot(vector, vector)) + epsilon
+        )
+        return factor * vector
+
+    @_jit
+    def _transp(point_a, point_b, tangent_vector_a):
+        return tangent_vector_a - np.dot(point_b, tangent_vector_a) * point_b
+
+    def inner(point, tangent_vector_a, tangent_vector_b):
+        return _inner(
+            _as_operand(tangent_vector_a), _as_operand(tangent_vector_b)
+        )
+
+    def norm(point, tangent_vector):
+        return _norm(_as_operand(tangent_vector))
+
+    def proj(point, vector):
+        return _proj(_as_operand(point), _as_operand(vector))
+
+    def dist(point_a, point_b):
+        return _dist(_as_operand(point_a), _as_operand(point_b))
+
+    def exp(point, tangent_vector):
+        return _exp(_as_operand(point), _as_operand(tangent_vector))
+
+    def retr(point, tangent_vector):
+        return _retr(_as_operand(point), _as_operand(tangent_vector))
+
+    def log(point_a, point_b):
+        return _log(_as_operand(point_a), _as_operand(point_b))
+
+    def transp(point_a, point_b, tangent_vector_a):
+        return _transp(
+            _as_operand(point_a),
+            _as_operand(point_b),
+            _as_operand(tangent_vector_a),
+        )
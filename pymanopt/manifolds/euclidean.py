@@ -24,6 +24,14 @@ class _Euclidean(EuclideanEmbeddedSubmanifold):
             )
         )
 
+    def inner_many(self, point, tangent_vectors_a, tangent_vectors_b):
+        tangent_vectors_a = np.asarray(tangent_vectors_a)
+        tangent_vectors_b = np.asarray(tangent_vectors_b)
+        return np.sum(
+            tangent_vectors_a * tangent_vectors_b,
+            axis=tuple(range(1, tangent_vectors_a.ndim)),
+        )
+
     def norm(self, point, tangent_vector):
         return la.norm(tangent_vector)
 
@@ -214,6 +214,96 @@ class Manifold(metaclass=abc.ABCMeta):
         ``point_a`` to the tangent space at `point_b`.
         """
 
+    def inner_many(self, point, tangent_vectors_a, tangent_vectors_b):
+        """Computes several inner products at a point in a single call.
+
+        Args:
+            point: The base point.
+            tangent_vectors_a: A sequence (or stacked array) of tangent
+                vectors.
+            tangent_vectors_b: A sequence (or stacked array) of tangent
+                vectors.
+
+        Returns:
+            An array of pairwise inner products between the tangent vectors
+            in ``tangent_vectors_a`` and ``tangent_vectors_b``.
+        """
+        return np.array(
+            [
+                self.inner(point, tangent_vector_a, tangent_vector_b)
+                for tangent_vector_a, tangent_vector_b in zip(
+                    tangent_vectors_a, tangent_vectors_b
+                )
+            ]
+        )
+
+    # Batched versions of the elementary operations.
+    #
+    # These act on points and tangent vectors stacked along a new leading
+    # axis, as used by population-based solvers such as
+    # :mod:`pymanopt.solvers.particle_swarm` to amortize the per-call
+    # overhead over the whole population.
+    # The default implementations simply loop over the leading axis and
+    # require points to be representable as arrays; manifolds for which the
+    # operations vectorize naturally should override them.
+
+    def retr_batch(self, points, tangent_vectors):
+        """Applies :meth:`retr` to a batch of points and tangent vectors.
+
+        Args:
+            points: An array of points stacked along the first axis.
+            tangent_vectors: An array of tangent vectors stacked along the
+                first axis.
+
+        Returns:
+            An array of retracted points stacked along the first axis.
+        """
+        return np.stack(
+            [
+                self.retr(point, tangent_vector)
+                for point, tangent_vector in zip(points, tangent_vectors)
+            ]
+        )
+
+    def log_batch(self, points_a, points_b):
+        """Applies :meth:`log` to a batch of point pairs.
+
+        Args:
+            points_a: An array of base points stacked along the first axis.
+            points_b: An array of target points stacked along the first axis.
+
+        Returns:
+            An array of tangent vectors stacked along the first axis.
+        """
+        return np.stack(
+            [
+                self.log(point_a, point_b)
+                for point_a, point_b in zip(points_a, points_b)
+            ]
+        )
+
+    def transp_batch(self, points_a, points_b, tangent_vectors_a):
+        """Applies :meth:`transp` to a batch of points and tangent vectors.
+
+        Args:
+            points_a: An array of source points stacked along the first axis.
+            points_b: An array of target points stacked along the first axis.
+            tangent_vectors_a: An array of tangent vectors stacked along the
+                first axis.
+
+        Returns:
+            An array of transported tangent vectors stacked along the first
+            axis.
+        """
+        return np.stack(
+            [
+                self.transp(point_a, point_b, tangent_vector_a)
+                for point_a, point_b, tangent_vector_a in zip(
+                    points_a, points_b, tangent_vectors_a
+                )
+            ]
+        )
+
     @_raise_not_implemented_error
     def pairmean(self, point_a, point_b):
         """Computes the intrinsic mean of two points on the manifold.
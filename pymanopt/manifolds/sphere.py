@@ -4,6 +4,7 @@ import numpy as np
 import numpy.linalg as la
 import numpy.random as rnd
 
+from pymanopt.manifolds import _sphere_kernels
 from pymanopt.manifolds.manifold import EuclideanEmbeddedSubmanifold
 
 
@@ -29,6 +30,14 @@ class _SphereBase(EuclideanEmbeddedSubmanifold):
             tangent_vector_a, tangent_vector_b, axes=tangent_vector_a.ndim
         )
 
+    def inner_many(self, point, tangent_vectors_a, tangent_vectors_b):
+        tangent_vectors_a = np.asarray(tangent_vectors_a)
+        tangent_vectors_b = np.asarray(tangent_vectors_b)
+        return np.sum(
+            tangent_vectors_a * tangent_vectors_b,
+            axis=tuple(range(1, tangent_vectors_a.ndim)),
+        )
+
     def norm(self, point, tangent_vector):
         return la.norm(tangent_vector)
 
@@ -67,6 +76,21 @@ class _SphereBase(EuclideanEmbeddedSubmanifold):
     def transp(self, point_a, point_b, tangent_vector_a):
         return self.proj(point_b, tangent_vector_a)
 
+    def retr_batch(self, points, tangent_vectors):
+        targets = points + tangent_vectors
+        return targets / self._batch_norm(targets)
+
+    def log_batch(self, points_a, points_b):
+        vectors = self._batch_proj(points_a, points_b - points_a)
+        inners = np.clip(self._batch_inner(points_a, points_b), -1, 1)
+        distances = np.arccos(inners)
+        epsilon = np.finfo(np.float64).eps
+        factors = (distances + epsilon) / (self._batch_norm(vectors) + epsilon)
+        return factors * vectors
+
+    def transp_batch(self, points_a, points_b, tangent_vectors_a):
+        return self._batch_proj(points_b, tangent_vectors_a)
+
     def pairmean(self, point_a, point_b):
         return self._normalize(point_a + point_b)
 
@@ -76,6 +100,23 @@ class _SphereBase(EuclideanEmbeddedSubmanifold):
     def _normalize(self, array):
         return array / la.norm(array)
 
+    def _batch_proj(self, points, vectors):
+        return vectors - self._batch_inner(points, vectors) * points
+
+    @staticmethod
+    def _batch_inner(array_a, array_b):
+        # Inner products over all but the leading (batch) axis. The kept
+        # singleton axes make the result broadcast against the batch arrays.
+        return np.sum(
+            array_a * array_b,
+            axis=tuple(range(1, array_a.ndim)),
+            keepdims=True,
+        )
+
+    @classmethod
+    def _batch_norm(cls, array):
+        return np.sqrt(cls._batch_inner(array, array))
+
 
 class Sphere(_SphereBase):
     r"""The sphere manifold.
@@ -100,6 +141,19 @@ class Sphere(_SphereBase):
         dimension = np.prod(shape) - 1
         super().__init__(*shape, name=name, dimension=dimension)
 
+        # For spheres of vectors the elementary operations boil down to dot
+        # products, so we shadow the generic methods with compiled kernels
+        # when Numba is available.
+        if len(shape) == 1 and _sphere_kernels.available:
+            self.inner = _sphere_kernels.inner
+            self.norm = _sphere_kernels.norm
+            self.proj = _sphere_kernels.proj
+            self.dist = _sphere_kernels.dist
+            self.exp = _sphere_kernels.exp
+            self.retr = _sphere_kernels.retr
+            self.log = _sphere_kernels.log
+            self.transp = _sphere_kernels.transp
+
 
 class _SphereSubspaceIntersectionManifold(_SphereBase):
     def __init__(self, projector, name, dimension):
@@ -126,6 +180,9 @@ class _SphereSubspaceIntersectionManifold(_SphereBase):
     def proj(self, point, vector):
         return self._subspace_projector @ super().proj(point, vector)
 
+    def _batch_proj(self, points, vectors):
+        return super()._batch_proj(points, vectors) @ self._subspace_projector
+
     def rand(self):
         point = super().rand()
         return self._normalize(self._subspace_projector @ point)
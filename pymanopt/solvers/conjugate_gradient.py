@@ -1,5 +1,4 @@
 import time
-from copy import deepcopy
 
 import numpy as np
 
@@ -16,6 +15,79 @@ BetaTypes = tools.make_enum(
 )
 
 
+class _CGState:
+    """State of a conjugate gradient iteration.
+
+    The ``__slots__`` layout stores the fields at fixed offsets on the
+    instance, so reading them in the hot loop avoids dictionary lookups and
+    the new-to-old handover at the end of an iteration is a single multiple
+    assignment.
+    """
+
+    __slots__ = (
+        "x",
+        "cost",
+        "grad",
+        "Pgrad",
+        "gradnorm",
+        "gradPgrad",
+        "desc_dir",
+    )
+
+    def __init__(self, x, cost, grad, Pgrad, gradnorm, gradPgrad, desc_dir):
+        self.x = x
+        self.cost = cost
+        self.grad = grad
+        self.Pgrad = Pgrad
+        self.gradnorm = gradnorm
+        self.gradPgrad = gradPgrad
+        self.desc_dir = desc_dir
+
+
+def _jax_manifold_ops(manifold):
+    """JAX-traceable manifold operations for the scan-based CG path.
+
+    Returns a tuple ``(inner, norm, proj, retr, transp)`` of JAX
+    implementations of the elementary operations of ``manifold``, or ``None``
+    if the manifold is not supported.
+    """
+    import jax.numpy as jnp
+
+    from pymanopt.manifolds.euclidean import Euclidean
+    from pymanopt.manifolds.sphere import Sphere
+
+    def inner(tangent_vector_a, tangent_vector_b):
+        return jnp.sum(tangent_vector_a * tangent_vector_b)
+
+    def norm(tangent_vector):
+        return jnp.sqrt(inner(tangent_vector, tangent_vector))
+
+    if type(manifold) is Euclidean:
+
+        def proj(point, vector):
+            return vector
+
+        def retr(point, tangent_vector):
+            return point + tangent_vector
+
+    elif type(manifold) is Sphere:
+
+        def proj(point, vector):
+            return vector - inner(point, vector) * point
+
+        def retr(point, tangent_vector):
+            target = point + tangent_vector
+            return target / norm(target)
+
+    else:
+        return None
+
+    def transp(point_a, point_b, tangent_vector_a):
+        return proj(point_b, tangent_vector_a)
+
+    return inner, norm, proj, retr, transp
+
+
 class ConjugateGradient(Solver):
     """Riemannian conjugate gradient method.
 
@@ -77,7 +149,14 @@ class ConjugateGradient(Solver):
         gradient = problem.grad
 
         if not reuselinesearch or self.linesearch is None:
-            self.linesearch = deepcopy(self._linesearch)
+            # Rebuild the line search rather than deep-copying it; custom
+            # line search objects without a `clone` method are still copied.
+            if hasattr(self._linesearch, "clone"):
+                self.linesearch = self._linesearch.clone()
+            else:
+                from copy import deepcopy
+
+                self.linesearch = deepcopy(self._linesearch)
         linesearch = self.linesearch
 
         # If no starting point is specified, generate one at random.
@@ -86,8 +165,15 @@ class ConjugateGradient(Solver):
 
         if verbosity >= 1:
             print("Optimizing...")
+
+        # For JAX-backed costs on manifolds whose operations are expressible
+        # in JAX, run blocks of iterations inside a single XLA program via
+        # jax.lax.scan instead of paying dispatch overhead per iteration.
+        if self._can_solve_with_scan(problem, linesearch):
+            return self._solve_with_scan(problem, x, linesearch)
+
         if verbosity >= 2:
-            iter_format_length = int(np.log10(self._maxiter)) + 1
+            iter_format_length = len(str(self._maxiter))
             column_printer = printer.ColumnPrinter(
                 columns=[
                     ("Iteration", f"{iter_format_length}d"),
@@ -100,15 +186,24 @@ class ConjugateGradient(Solver):
 
         column_printer.print_header()
 
+        # When no preconditioner was supplied, skip the identity call and let
+        # the preconditioned gradient alias the gradient itself.
+        precon_is_identity = getattr(problem, "_precon_is_identity", False)
+
         # Calculate initial cost-related quantities
         cost = objective(x)
         grad = gradient(x)
         gradnorm = man.norm(x, grad)
-        Pgrad = problem.precon(x, grad)
-        gradPgrad = man.inner(x, grad, Pgrad)
+        if precon_is_identity:
+            Pgrad = grad
+            gradPgrad = gradnorm**2
+        else:
+            Pgrad = problem.precon(x, grad)
+            gradPgrad = man.inner(x, grad, Pgrad)
 
-        # Initial descent direction is the negative gradient
-        desc_dir = -Pgrad
+        # Pack the iteration state into a slotted object; the initial descent
+        # direction is the negative (preconditioned) gradient.
+        state = _CGState(x, cost, grad, Pgrad, gradnorm, gradPgrad, -Pgrad)
 
         self._start_optlog(
             extraiterfields=["gradnorm"],
@@ -125,13 +220,18 @@ class ConjugateGradient(Solver):
         time0 = time.time()
 
         while True:
-            column_printer.print_row([iter, cost, gradnorm])
+            column_printer.print_row([iter, state.cost, state.gradnorm])
 
             if self._logverbosity >= 2:
-                self._append_optlog(iter, x, cost, gradnorm=gradnorm)
+                self._append_optlog(
+                    iter, state.x, state.cost, gradnorm=state.gradnorm
+                )
 
             stop_reason = self._check_stopping_criterion(
-                time0, gradnorm=gradnorm, iter=iter + 1, stepsize=stepsize
+                time0,
+                gradnorm=state.gradnorm,
+                iter=iter + 1,
+                stepsize=stepsize,
             )
 
             if stop_reason:
@@ -140,9 +240,11 @@ class ConjugateGradient(Solver):
                     print("")
                 break
 
+            x = state.x
+
             # The line search algorithms require the directional derivative of
             # the cost at the current point x along the search direction.
-            df0 = man.inner(x, grad, desc_dir)
+            df0 = man.inner(x, state.grad, state.desc_dir)
 
             # If we didn't get a descent direction: restart, i.e., switch to
             # the negative gradient. Equivalent to resetting the CG direction
@@ -156,23 +258,27 @@ class ConjugateGradient(Solver):
                         "steepest descent direction."
                     )
                 # Reset to negative gradient: this discards the CG memory.
-                desc_dir = -Pgrad
-                df0 = -gradPgrad
+                state.desc_dir = -state.Pgrad
+                df0 = -state.gradPgrad
 
             # Execute line search
             stepsize, newx = linesearch.search(
-                objective, man, x, desc_dir, cost, df0
+                objective, man, x, state.desc_dir, state.cost, df0
             )
 
             # Compute the new cost-related quantities for newx
             newcost = objective(newx)
             newgrad = gradient(newx)
             newgradnorm = man.norm(newx, newgrad)
-            Pnewgrad = problem.precon(newx, newgrad)
-            newgradPnewgrad = man.inner(newx, newgrad, Pnewgrad)
+            if precon_is_identity:
+                Pnewgrad = newgrad
+                newgradPnewgrad = newgradnorm**2
+            else:
+                Pnewgrad = problem.precon(newx, newgrad)
+                newgradPnewgrad = man.inner(newx, newgrad, Pnewgrad)
 
             # Apply the CG scheme to compute the next search direction
-            oldgrad = man.transp(x, newx, grad)
+            oldgrad = man.transp(x, newx, state.grad)
             orth_grads = man.inner(newx, oldgrad, Pnewgrad) / newgradPnewgrad
 
             # Powell's restart strategy (see page 12 of Hager and Zhang's
@@ -181,40 +287,53 @@ class ConjugateGradient(Solver):
                 beta = 0
                 desc_dir = -Pnewgrad
             else:
-                desc_dir = man.transp(x, newx, desc_dir)
+                desc_dir = man.transp(x, newx, state.desc_dir)
 
                 if self._beta_type == BetaTypes.FletcherReeves:
-                    beta = newgradPnewgrad / gradPgrad
+                    beta = newgradPnewgrad / state.gradPgrad
                 elif self._beta_type == BetaTypes.PolakRibiere:
                     diff = newgrad - oldgrad
                     ip_diff = man.inner(newx, Pnewgrad, diff)
-                    beta = max(0, ip_diff / gradPgrad)
+                    beta = max(0, ip_diff / state.gradPgrad)
                 elif self._beta_type == BetaTypes.HestenesStiefel:
                     diff = newgrad - oldgrad
-                    ip_diff = man.inner(newx, Pnewgrad, diff)
+                    ip_diff, deno = man.inner_many(
+                        newx, [Pnewgrad, diff], [diff, desc_dir]
+                    )
                     try:
-                        beta = max(
-                            0, ip_diff / man.inner(newx, diff, desc_dir)
-                        )
+                        beta = max(0, float(ip_diff) / float(deno))
                     # if ip_diff = man.inner(newx, diff, desc_dir) = 0
                     except ZeroDivisionError:
                         beta = 1
                 elif self._beta_type == BetaTypes.HagerZhang:
                     diff = newgrad - oldgrad
-                    Poldgrad = man.transp(x, newx, Pgrad)
+                    # With an identity preconditioner the transported
+                    # preconditioned gradient is the transported gradient,
+                    # which was already computed above.
+                    if precon_is_identity:
+                        Poldgrad = oldgrad
+                    else:
+                        Poldgrad = man.transp(x, newx, state.Pgrad)
                     Pdiff = Pnewgrad - Poldgrad
-                    deno = man.inner(newx, diff, desc_dir)
-                    numo = man.inner(newx, diff, Pnewgrad)
-                    numo -= (
-                        2
-                        * man.inner(newx, diff, Pdiff)
-                        * man.inner(newx, desc_dir, newgrad)
-                        / deno
+                    # Batch the inner products of this rule, including the
+                    # squared norm of the search direction, so the manifold
+                    # can compute them in one pass.
+                    (
+                        deno,
+                        numo,
+                        ip_diff_Pdiff,
+                        ip_dir_newgrad,
+                        desc_dir_sqnorm,
+                    ) = man.inner_many(
+                        newx,
+                        [diff, diff, diff, desc_dir, desc_dir],
+                        [desc_dir, Pnewgrad, Pdiff, newgrad, desc_dir],
                     )
+                    numo -= 2 * ip_diff_Pdiff * ip_dir_newgrad / deno
                     beta = numo / deno
                     # Robustness (see Hager-Zhang paper mentioned above)
-                    desc_dir_norm = man.norm(newx, desc_dir)
-                    eta_HZ = -1 / (desc_dir_norm * min(0.01, gradnorm))
+                    desc_dir_norm = np.sqrt(desc_dir_sqnorm)
+                    eta_HZ = -1 / (desc_dir_norm * min(0.01, state.gradnorm))
                     beta = max(beta, eta_HZ)
                 else:
                     types = ", ".join(
@@ -225,28 +344,273 @@ class ConjugateGradient(Solver):
                         f"of {types}."
                     )
 
-                desc_dir = -Pnewgrad + beta * desc_dir
-
-            # Update the necessary variables for the next iteration.
-            x = newx
-            cost = newcost
-            grad = newgrad
-            Pgrad = Pnewgrad
-            gradnorm = newgradnorm
-            gradPgrad = newgradPnewgrad
+                # Fuse the direction update in place when possible to avoid
+                # materializing two temporaries of the size of a manifold
+                # element. Manifolds with structured tangent vectors (e.g.
+                # products of manifolds) take the allocating path.
+                if (
+                    type(desc_dir) is np.ndarray
+                    and type(Pnewgrad) is np.ndarray
+                    and desc_dir.dtype == Pnewgrad.dtype
+                ):
+                    np.multiply(desc_dir, beta, out=desc_dir)
+                    np.subtract(desc_dir, Pnewgrad, out=desc_dir)
+                else:
+                    desc_dir = -Pnewgrad + beta * desc_dir
+
+            # Rebind the new quantities as the state of the next iteration.
+            (
+                state.x,
+                state.cost,
+                state.grad,
+                state.Pgrad,
+                state.gradnorm,
+                state.gradPgrad,
+                state.desc_dir,
+            ) = (
+                newx,
+                newcost,
+                newgrad,
+                Pnewgrad,
+                newgradnorm,
+                newgradPnewgrad,
+                desc_dir,
+            )
 
             iter += 1
 
         if self._logverbosity <= 0:
-            return x
+            return state.x
         else:
             self._stop_optlog(
-                x,
-                cost,
+                state.x,
+                state.cost,
                 stop_reason,
                 time0,
                 stepsize=stepsize,
-                gradnorm=gradnorm,
+                gradnorm=state.gradnorm,
                 iter=iter,
             )
-            return x, self._optlog
+            return state.x, self._optlog
+
+    def _can_solve_with_scan(self, problem, linesearch):
+        """Checks whether :meth:`_solve_with_scan` is applicable."""
+        if problem.verbosity >= 2 or self._logverbosity > 0:
+            return False
+        if not getattr(problem, "_precon_is_identity", False):
+            return False
+        if type(linesearch) is not LineSearchAdaptive:
+            return False
+        backend = getattr(problem._original_cost, "_backend", None)
+        if backend is None or str(backend) != "Jax":
+            return False
+        return _jax_manifold_ops(problem.manifold) is not None
+
+    def _solve_with_scan(self, problem, x, linesearch, block_size=16):
+        """Run the CG method with jax.lax.scan over blocks of iterations.
+
+        Each CG step, including the adaptive line search, is expressed as a
+        pure JAX function, and ``block_size`` steps at a time run as a single
+        XLA program. The host only checks the stopping criteria between
+        blocks; the gradient-norm and stepsize criteria are also evaluated
+        inside the scan so that a converged state passes through the
+        remainder of its block unchanged.
+        """
+        import jax
+        import jax.numpy as jnp
+
+        man = problem.manifold
+        verbosity = problem.verbosity
+        objective = problem.cost
+        egrad = problem.egrad
+        inner, norm, proj, retr, transp = _jax_manifold_ops(man)
+
+        contraction_factor = linesearch._contraction_factor
+        suff_decr = linesearch._suff_decr
+        ls_maxiter = linesearch._maxiter
+        initial_stepsize = linesearch._initial_stepsize
+        beta_type = self._beta_type
+        orth_value = self._orth_value
+        mingradnorm = self._mingradnorm
+        minstepsize = self._minstepsize
+
+        def gradient(point):
+            return proj(point, egrad(point))
+
+        def search(point, desc_dir, cost, df0, oldalpha):
+            # The adaptive line search with its state threaded explicitly;
+            # an `oldalpha` below zero marks the unset state.
+            norm_d = norm(desc_dir)
+            alpha = jnp.where(oldalpha >= 0, oldalpha, initial_stepsize / norm_d)
+
+            def try_step(alpha):
+                newx = retr(point, alpha * desc_dir)
+                return newx, objective(newx)
+
+            newx, newf = try_step(alpha)
+
+            def backtrack_condition(state):
+                alpha, _, newf, cost_evaluations = state
+                return (newf > cost + suff_decr * alpha * df0) & (
+                    cost_evaluations <= ls_maxiter
+                )
+
+            def backtrack(state):
+                alpha, _, _, cost_evaluations = state
+                alpha = contraction_factor * alpha
+                newx, newf = try_step(alpha)
+                return alpha, newx, newf, cost_evaluations + 1
+
+            alpha, newx, newf, cost_evaluations = jax.lax.while_loop(
+                backtrack_condition, backtrack, (alpha, newx, newf, 1)
+            )
+
+            reject = newf > cost
+            alpha = jnp.where(reject, 0.0, alpha)
+            newx = jnp.where(reject, point, newx)
+            newf = jnp.where(reject, cost, newf)
+            oldalpha = jnp.where(cost_evaluations == 2, alpha, 2 * alpha)
+            return alpha * norm_d, newx, newf, oldalpha
+
+        def step(carry, _):
+            (
+                x,
+                cost,
+                grad,
+                desc_dir,
+                gradnorm,
+                gradPgrad,
+                oldalpha,
+                stepsize,
+                iteration,
+                done,
+            ) = carry
+
+            df0 = inner(grad, desc_dir)
+            # Reset to the steepest descent direction if we did not get a
+            # descent direction.
+            ascent = df0 >= 0
+            desc_dir = jnp.where(ascent, -grad, desc_dir)
+            df0 = jnp.where(ascent, -gradPgrad, df0)
+
+            newstepsize, newx, newcost, newoldalpha = search(
+                x, desc_dir, cost, df0, oldalpha
+            )
+            newgrad = gradient(newx)
+            newgradnorm = norm(newgrad)
+            newgradPnewgrad = newgradnorm**2
+
+            oldgrad = transp(x, newx, grad)
+            orth_grads = inner(oldgrad, newgrad) / newgradPnewgrad
+            desc_dir_t = transp(x, newx, desc_dir)
+
+            if beta_type == BetaTypes.FletcherReeves:
+                beta = newgradPnewgrad / gradPgrad
+            elif beta_type == BetaTypes.PolakRibiere:
+                diff = newgrad - oldgrad
+                beta = jnp.maximum(0, inner(newgrad, diff) / gradPgrad)
+            elif beta_type == BetaTypes.HestenesStiefel:
+                diff = newgrad - oldgrad
+                deno = inner(diff, desc_dir_t)
+                beta = jnp.where(
+                    deno == 0,
+                    1.0,
+                    jnp.maximum(0, inner(newgrad, diff) / deno),
+                )
+            elif beta_type == BetaTypes.HagerZhang:
+                diff = newgrad - oldgrad
+                deno = inner(diff, desc_dir_t)
+                numo = inner(diff, newgrad)
+                numo -= (
+                    2 * inner(diff, diff) * inner(desc_dir_t, newgrad) / deno
+                )
+                beta = numo / deno
+                # Robustness (see Hager-Zhang paper referenced in `solve`)
+                eta_HZ = -1 / (norm(desc_dir_t) * jnp.minimum(0.01, gradnorm))
+                beta = jnp.maximum(beta, eta_HZ)
+            else:
+                types = ", ".join([f"BetaTypes.{t}" for t in BetaTypes._fields])
+                raise ValueError(
+                    f"Unknown beta_type {beta_type}. Should be one of {types}."
+                )
+
+            # Powell's restart strategy.
+            restart = jnp.abs(orth_grads) >= orth_value
+            newdesc_dir = jnp.where(
+                restart, -newgrad, -newgrad + beta * desc_dir_t
+            )
+
+            newdone = done | (newgradnorm < mingradnorm) | (
+                newstepsize < minstepsize
+            )
+            new_carry = (
+                newx,
+                newcost,
+                newgrad,
+                newdesc_dir,
+                newgradnorm,
+                newgradPnewgrad,
+                newoldalpha,
+                newstepsize,
+                iteration + 1,
+                newdone,
+            )
+            # Once converged, let the state pass through unchanged so the
+            # iteration count and iterate stay those of the converged state.
+            carry = jax.tree_util.tree_map(
+                lambda old, new: jnp.where(done, old, new), carry, new_carry
+            )
+            return carry, None
+
+        def run_block(carry, num_steps):
+            carry, _ = jax.lax.scan(step, carry, None, length=num_steps)
+            return carry
+
+        run_block = jax.jit(run_block, static_argnums=1)
+
+        self._start_optlog(
+            extraiterfields=["gradnorm"],
+            solverparams={
+                "beta_type": self._beta_type,
+                "orth_value": self._orth_value,
+                "linesearcher": linesearch,
+            },
+        )
+
+        x = jnp.asarray(x)
+        cost = objective(x)
+        grad = gradient(x)
+        gradnorm = norm(grad)
+        carry = (
+            x,
+            cost,
+            grad,
+            -grad,
+            gradnorm,
+            gradnorm**2,
+            jnp.asarray(-1.0),
+            jnp.asarray(jnp.nan),
+            jnp.asarray(0),
+            gradnorm < mingradnorm,
+        )
+
+        time0 = time.time()
+
+        while True:
+            iteration = int(carry[8])
+            stop_reason = self._check_stopping_criterion(
+                time0,
+                gradnorm=float(carry[4]),
+                iter=iteration + 1,
+                stepsize=float(carry[7]),
+            )
+            if stop_reason:
+                if verbosity >= 1:
+                    print(stop_reason)
+                    print("")
+                break
+            carry = run_block(
+                carry, min(block_size, self._maxiter - 1 - iteration)
+            )
+
+        return np.asarray(carry[0])
@@ -17,6 +17,20 @@ class LineSearchBackTracking:
 
         self._oldf0 = None
 
+    def clone(self):
+        """Create a new instance of the line search with pristine state.
+
+        Returns:
+            A new line search object configured with the same parameters.
+        """
+        return type(self)(
+            contraction_factor=self.contraction_factor,
+            optimism=self.optimism,
+            suff_decr=self.suff_decr,
+            maxiter=self.maxiter,
+            initial_stepsize=self.initial_stepsize,
+        )
+
     def search(self, objective, manifold, x, d, f0, df0):
         """Function to perform backtracking line search.
 
@@ -92,6 +106,19 @@ class LineSearchAdaptive:
         self._initial_stepsize = initial_stepsize
         self._oldalpha = None
 
+    def clone(self):
+        """Create a new instance of the line search with pristine state.
+
+        Returns:
+            A new line search object configured with the same parameters.
+        """
+        return type(self)(
+            contraction_factor=self._contraction_factor,
+            suff_decr=self._suff_decr,
+            maxiter=self._maxiter,
+            initial_stepsize=self._initial_stepsize,
+        )
+
     def search(self, objective, man, x, d, f0, df0):
         norm_d = man.norm(x, d)
 
@@ -82,18 +82,52 @@ class ParticleSwarm(Solver):
                 )
                 self._populationsize = len(x)
 
-        # Initialize personal best positions to the initial population.
-        y = list(x)
+        # Stack the swarm into a single array of shape (populationsize, ...)
+        # when points are plain arrays so that the batched manifold operations
+        # vectorize over the population. Manifolds with structured points
+        # (e.g. products of manifolds) fall back to the per-particle path.
+        vectorized = (
+            isinstance(x[0], np.ndarray) and x[0].dtype != np.object_
+        )
+
+        # When the cost is backed by JAX and the swarm is stacked, map the
+        # cost over the population so that all particle costs are computed in
+        # a single call instead of one dispatch per particle.
+        objective_batch = None
+        backend = getattr(problem._original_cost, "_backend", None)
+        if vectorized and backend is not None and str(backend) == "Jax":
+            import jax
+
+            objective_batch = jax.jit(jax.vmap(objective))
+
+        if vectorized:
+            v = np.stack([man.randvec(xi) for xi in x])
+            x = np.stack(x)
+
+            # Initialize personal best positions to the initial population.
+            y = x.copy()
+
+            # Save a copy of the swarm at the previous iteration.
+            xprev = x.copy()
+        else:
+            # Initialize personal best positions to the initial population.
+            y = list(x)
 
-        # Save a copy of the swarm at the previous iteration.
-        xprev = list(x)
+            # Save a copy of the swarm at the previous iteration.
+            xprev = list(x)
 
-        # Initialize velocities for each particle.
-        v = [man.randvec(xi) for xi in x]
+            # Initialize velocities for each particle.
+            v = [man.randvec(xi) for xi in x]
 
         # Compute cost for each particle xi.
-        costs = np.array([objective(xi) for xi in x])
-        fy = list(costs)
+        if objective_batch is not None:
+            costs = np.asarray(objective_batch(x))
+        else:
+            costs = np.array([objective(xi) for xi in x])
+        if vectorized:
+            fy = costs.copy()
+        else:
+            fy = list(costs)
         costevals = self._populationsize
 
         # Identify the best particle and store its cost/position.
@@ -102,7 +136,7 @@ class ParticleSwarm(Solver):
         xbest = x[imin]
 
         if verbosity >= 2:
-            iter_format_length = int(np.log10(self._maxiter)) + 1
+            iter_format_length = len(str(self._maxiter))
             column_printer = printer.ColumnPrinter(
                 columns=[
                     ("Iteration", f"{iter_format_length}d"),
@@ -127,13 +161,11 @@ class ParticleSwarm(Solver):
 
             column_printer.print_row([iter, costevals, fbest])
 
-            # Stop if any particle triggers a stopping criterion.
-            for i, xi in enumerate(x):
-                stop_reason = self._check_stopping_criterion(
-                    time0, iter=iter, costevals=costevals
-                )
-                if stop_reason is not None:
-                    break
+            # The stopping criteria do not depend on individual particles, so
+            # a single check per iteration suffices.
+            stop_reason = self._check_stopping_criterion(
+                time0, iter=iter, costevals=costevals
+            )
             if stop_reason:
                 if verbosity >= 1:
                     print(stop_reason)
@@ -144,43 +176,89 @@ class ParticleSwarm(Solver):
             # 0.4 from iter = 0 to iter = maxiter.
             w = 0.4 + 0.5 * (1 - iter / self._maxiter)
 
-            # Compute the velocities.
-            for i, xi in enumerate(x):
-                # Get the position and past best position of particle i.
-                yi = y[i]
-
-                # Get the previous position and velocity of particle i.
-                xiprev = xprev[i]
-                vi = v[i]
-
-                # Compute the new velocity of particle i, composed of three
-                # contributions.
-                inertia = w * man.transp(xiprev, xi, vi)
-                nostalgia = rnd.rand() * self._nostalgia * man.log(xi, yi)
-                social = rnd.rand() * self._social * man.log(xi, xbest)
-
-                v[i] = inertia + nostalgia + social
-
-            # Backup the current swarm positions.
-            xprev = list(x)
-
-            # Update positions, personal bests and global best.
-            for i, xi in enumerate(x):
-                # Compute new position of particle i.
-                x[i] = man.retr(xi, v[i])
-                # Compute new cost of particle i.
-                fxi = objective(xi)
-
-                # Update costs of the swarm.
-                costs[i] = fxi
-                # Update self-best if necessary.
-                if fxi < fy[i]:
-                    fy[i] = fxi
-                    y[i] = xi
-                    # Update global best if necessary.
-                    if fy[i] < fbest:
-                        fbest = fy[i]
-                        xbest = xi
+            # Draw all random coefficients of this iteration in a single call
+            # instead of two scalar draws per particle.
+            coefficients = rnd.rand(len(x), 2)
+
+            if vectorized:
+                # Compute the velocities of the whole swarm at once, composed
+                # of three contributions.
+                coefficient_shape = (-1,) + (1,) * (x.ndim - 1)
+                inertia = w * man.transp_batch(xprev, x, v)
+                nostalgia = (
+                    coefficients[:, 0].reshape(coefficient_shape)
+                    * self._nostalgia
+                    * man.log_batch(x, y)
+                )
+                social = (
+                    coefficients[:, 1].reshape(coefficient_shape)
+                    * self._social
+                    * man.log_batch(x, np.broadcast_to(xbest, x.shape))
+                )
+                v = inertia + nostalgia + social
+
+                # Backup the current swarm positions and update them.
+                xprev = x
+                x = man.retr_batch(x, v)
+
+                # Compute the new cost of each particle.
+                if objective_batch is not None:
+                    costs = np.asarray(objective_batch(x))
+                else:
+                    costs = np.array([objective(xi) for xi in x])
+
+                # Update personal bests and the global best in one pass over
+                # the cost arrays instead of branching per particle.
+                improved = costs < fy
+                fy = np.where(improved, costs, fy)
+                y[improved] = x[improved]
+                imin = fy.argmin()
+                if fy[imin] < fbest:
+                    fbest = fy[imin]
+                    xbest = y[imin].copy()
+            else:
+                # Compute the velocities.
+                for i, xi in enumerate(x):
+                    # Get the position and past best position of particle i.
+                    yi = y[i]
+
+                    # Get the previous position and velocity of particle i.
+                    xiprev = xprev[i]
+                    vi = v[i]
+
+                    # Compute the new velocity of particle i, composed of
+                    # three contributions.
+                    inertia = w * man.transp(xiprev, xi, vi)
+                    nostalgia = (
+                        coefficients[i, 0] * self._nostalgia * man.log(xi, yi)
+                    )
+                    social = (
+                        coefficients[i, 1] * self._social * man.log(xi, xbest)
+                    )
+
+                    v[i] = inertia + nostalgia + social
+
+                # Backup the current swarm positions.
+                xprev = list(x)
+
+                # Update positions, personal bests and global best.
+                for i, xi in enumerate(x):
+                    # Compute new position of particle i.
+                    new_xi = man.retr(xi, v[i])
+                    x[i] = new_xi
+                    # Compute the cost of particle i at its new position.
+                    fxi = objective(new_xi)
+
+                    # Update costs of the swarm.
+                    costs[i] = fxi
+                    # Update self-best if necessary.
+                    if fxi < fy[i]:
+                        fy[i] = fxi
+                        y[i] = new_xi
+                        # Update global best if necessary.
+                        if fy[i] < fbest:
+                            fbest = fy[i]
+                            xbest = new_xi
             costevals += self._populationsize
 
         if self._logverbosity <= 0:
@@ -64,7 +64,7 @@ class SteepestDescent(Solver):
         if verbosity >= 1:
             print("Optimizing...")
         if verbosity >= 2:
-            iter_format_length = int(np.log10(self._maxiter)) + 1
+            iter_format_length = len(str(self._maxiter))
             column_printer = printer.ColumnPrinter(
                 columns=[
                     ("Iteration", f"{iter_format_length}d"),
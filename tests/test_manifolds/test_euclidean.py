@@ -34,6 +34,16 @@ class TestEuclideanManifold(TestCase):
         z = e.randvec(x)
         np_testing.assert_almost_equal(np.sum(y * z), e.inner(x, y, z))
 
+    def test_inner_many(self):
+        e = self.man
+        x = e.rand()
+        U = [e.randvec(x) for _ in range(4)]
+        V = [e.randvec(x) for _ in range(4)]
+        np_testing.assert_allclose(
+            e.inner_many(x, U, V),
+            np.array([e.inner(x, u, v) for u, v in zip(U, V)]),
+        )
+
     def test_proj(self):
         e = self.man
         x = e.rand()
@@ -130,6 +130,66 @@ class TestSphereManifold(TestCase):
 
         np_testing.assert_allclose(s.transp(x, y, u), s.proj(y, u))
 
+    def test_inner_many(self):
+        s = self.man
+        x = s.rand()
+        U = [s.randvec(x) for _ in range(4)]
+        V = [s.randvec(x) for _ in range(4)]
+        np_testing.assert_allclose(
+            s.inner_many(x, U, V),
+            np.array([s.inner(x, u, v) for u, v in zip(U, V)]),
+        )
+
+    def test_retr_batch(self):
+        s = self.man
+        X = np.stack([s.rand() for _ in range(5)])
+        U = np.stack([s.randvec(x) for x in X])
+        np_testing.assert_allclose(
+            s.retr_batch(X, U),
+            np.stack([s.retr(x, u) for x, u in zip(X, U)]),
+        )
+
+    def test_log_batch(self):
+        s = self.man
+        X = np.stack([s.rand() for _ in range(5)])
+        Y = np.stack([s.rand() for _ in range(5)])
+        np_testing.assert_allclose(
+            s.log_batch(X, Y),
+            np.stack([s.log(x, y) for x, y in zip(X, Y)]),
+        )
+
+    def test_transp_batch(self):
+        s = self.man
+        X = np.stack([s.rand() for _ in range(5)])
+        Y = np.stack([s.rand() for _ in range(5)])
+        U = np.stack([s.randvec(x) for x in X])
+        np_testing.assert_allclose(
+            s.transp_batch(X, Y, U),
+            np.stack([s.transp(x, y, u) for x, y, u in zip(X, Y, U)]),
+        )
+
+    def test_solver_with_jax_cost_on_vector_sphere(self):
+        # Regression test: the compiled kernels bound on spheres of vectors
+        # must accept the read-only arrays produced by a JAX-backed cost.
+        import pymanopt
+        from pymanopt.solvers import SteepestDescent
+
+        n = 10
+        manifold = Sphere(n)
+        matrix = rnd.randn(n, n)
+        matrix = 0.5 * (matrix + matrix.T)
+
+        @pymanopt.function.jax(manifold)
+        def cost(x):
+            return -x @ matrix @ x
+
+        problem = pymanopt.Problem(manifold, cost, verbosity=0)
+        x = SteepestDescent().solve(problem)
+        np_testing.assert_almost_equal(la.norm(x), 1)
+        np_testing.assert_almost_equal(
+            -cost(x), la.eigvalsh(matrix)[-1], decimal=5
+        )
+
     def test_exp_log_inverse(self):
         s = self.man
         X = s.rand()